@@ -0,0 +1,313 @@
+import contextlib
+import os
+import sys
+from collections import deque
+
+from pascalanalyzer import Analyzer, TOKEN, SYMBOL, LINE
+
+def bits(value):
+    '''Yields the index of every set bit of a non-negative integer.'''
+    while value:
+        low = value & -value
+        yield low.bit_length() - 1
+        value ^= low
+
+class FlowGraph:
+    '''Control flow graph of a procedure body, one node per statement.
+
+    Variable sets are integers used as bitsets, bit i being the i-th tracked
+    variable of the procedure. Node 0 is the entry, which defines the
+    variables that already hold a value (parameters).'''
+    def __init__(self, initialized):
+        self.defs = []
+        self.uses = []
+        self.lines = []
+        self.succ = []
+        self.pred = []
+        self.node([], initialized, 0, None)
+
+    def node(self, preds, defs, uses, line):
+        '''Adds a node reached from every node in preds and returns it.'''
+        node = len(self.defs)
+        self.defs.append(defs)
+        self.uses.append(uses)
+        self.lines.append(line)
+        self.succ.append([])
+        self.pred.append([])
+        for p in preds:
+            self.edge(p, node)
+        return node
+
+    def edge(self, source, target):
+        self.succ[source].append(target)
+        self.pred[target].append(source)
+
+    def definitely_assigned(self):
+        '''Forward must-analysis: variables assigned on every path into each node.'''
+        size = len(self.defs)
+        full = -1 # every bit set
+        assigned_in = [full] * size
+        assigned_out = [full] * size
+        assigned_in[0] = 0
+        assigned_out[0] = self.defs[0]
+
+        worklist = deque(range(1, size))
+        queued = [True] * size
+        while worklist:
+            node = worklist.popleft()
+            queued[node] = False
+
+            value = full
+            for p in self.pred[node]:
+                value &= assigned_out[p]
+            assigned_in[node] = value
+
+            value |= self.defs[node]
+            if value != assigned_out[node]:
+                assigned_out[node] = value
+                for s in self.succ[node]:
+                    if not queued[s]:
+                        queued[s] = True
+                        worklist.append(s)
+        return assigned_in
+
+    def live(self):
+        '''Backward may-analysis: variables read later on some path out of each node.'''
+        size = len(self.defs)
+        live_in = [0] * size
+        live_out = [0] * size
+
+        worklist = deque(range(size - 1, -1, -1))
+        queued = [True] * size
+        while worklist:
+            node = worklist.popleft()
+            queued[node] = False
+
+            value = 0
+            for s in self.succ[node]:
+                value |= live_in[s]
+            live_out[node] = value
+
+            value = self.uses[node] | (value & ~self.defs[node])
+            if value != live_in[node]:
+                live_in[node] = value
+                for p in self.pred[node]:
+                    if not queued[p]:
+                        queued[p] = True
+                        worklist.append(p)
+        return live_out
+
+class Lint:
+    '''Finds uninitialized reads, dead assignments and unused variables.
+
+    Expects tokens of a program that already passed the Analyzer. Each
+    procedure body (and the program body) gets its own FlowGraph over its
+    parameters and local variables. Variables also referenced by nested
+    procedures are not tracked, since those can read or assign them at any
+    call.'''
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.counter = 0
+        self.sym = None
+        self.warnings = [] # (line, message)
+
+    def get_next_token(self):
+        token = self.tokens[self.counter]
+        self.counter += 1
+        return token
+
+    def run(self):
+        '''Checks the whole program and returns the warnings sorted by line.'''
+        self.sym = self.get_next_token() # program
+        self.sym = self.get_next_token() # name
+        self.sym = self.get_next_token() # ;
+        self.sym = self.get_next_token()
+        self.block('program', [])
+        self.warnings.sort(key=lambda warning: int(warning[0]))
+        return self.warnings
+
+    def block(self, name, parameters):
+        '''Checks var declarations, nested procedures and body of a block.
+
+        Returns the names it references but does not declare.'''
+        variables = self.var_declarations()
+        declared = set(identifier for identifier, line in parameters + variables)
+
+        escaping = set()
+        while self.sym[TOKEN] == 'procedure':
+            escaping |= self.procedure()
+            self.sym = self.get_next_token() # ;
+
+        # bit i of every set is the i-th tracked variable
+        tracked = [(identifier, line) for identifier, line in parameters + variables
+                   if identifier not in escaping]
+        self.slots = {identifier: 1 << i for i, (identifier, line) in enumerate(tracked)}
+        self.references = set()
+
+        initialized = 0
+        for identifier, line in parameters:
+            initialized |= self.slots.get(identifier, 0)
+
+        self.graph = FlowGraph(initialized)
+        exits = self.compound_command([0])
+        self.graph.node(exits, 0, 0, None)
+        tracked_parameters = len([p for p in parameters if p[0] not in escaping])
+        self.check(name, tracked, tracked_parameters)
+
+        return (self.references | escaping) - declared
+
+    def procedure(self):
+        # procedure id arguments; block
+        self.sym = self.get_next_token()
+        name = self.sym[TOKEN]
+        self.sym = self.get_next_token()
+
+        parameters = []
+        if self.sym[TOKEN] == '(':
+            while self.sym[TOKEN] != ')':
+                self.sym = self.get_next_token()
+                if self.sym[SYMBOL] == 'identifier':
+                    parameters.append((self.sym[TOKEN], self.sym[LINE]))
+            self.sym = self.get_next_token()
+
+        self.sym = self.get_next_token() # ;
+        return self.block(name, parameters)
+
+    def var_declarations(self):
+        variables = []
+        if self.sym[TOKEN] != 'var':
+            return variables
+
+        self.sym = self.get_next_token()
+        while self.sym[SYMBOL] == 'identifier':
+            # list_of_ids: type;
+            while self.sym[TOKEN] != ';':
+                if self.sym[SYMBOL] == 'identifier':
+                    variables.append((self.sym[TOKEN], self.sym[LINE]))
+                self.sym = self.get_next_token()
+            self.sym = self.get_next_token()
+        return variables
+
+    def compound_command(self, preds):
+        # begin optional_commands end
+        self.sym = self.get_next_token()
+        if self.sym[TOKEN] != 'end':
+            preds = self.command(preds)
+            while self.sym[TOKEN] == ';':
+                self.sym = self.get_next_token()
+                preds = self.command(preds)
+        self.sym = self.get_next_token() # end
+        return preds
+
+    def command(self, preds):
+        '''Adds the nodes of a command after preds and returns its exit nodes.'''
+        line = self.sym[LINE]
+
+        if self.sym[TOKEN] == 'begin':
+            return self.compound_command(preds)
+
+        if self.sym[TOKEN] == 'if':
+            self.sym = self.get_next_token()
+            condition = self.graph.node(preds, 0, self.expression(), line)
+            self.sym = self.get_next_token() # then
+            exits = self.command([condition])
+            if self.sym[TOKEN] != 'else':
+                return exits + [condition]
+            self.sym = self.get_next_token()
+            return exits + self.command([condition])
+
+        if self.sym[TOKEN] == 'while':
+            self.sym = self.get_next_token()
+            condition = self.graph.node(preds, 0, self.expression(), line)
+            self.sym = self.get_next_token() # do
+            for node in self.command([condition]):
+                self.graph.edge(node, condition)
+            return [condition]
+
+        if self.sym[SYMBOL] == 'identifier':
+            identifier = self.sym[TOKEN]
+            self.sym = self.get_next_token()
+            if self.sym[TOKEN] == ':=':
+                # variable := expression
+                self.references.add(identifier)
+                self.sym = self.get_next_token()
+                uses = self.expression()
+                return [self.graph.node(preds, self.slots.get(identifier, 0), uses, line)]
+
+            # procedure_activation
+            self.references.add(identifier)
+            return [self.graph.node(preds, 0, self.expression(), line)]
+
+        return preds # empty command
+
+    def expression(self):
+        '''Skips an expression and returns the set of tracked variables it reads.'''
+        uses = 0
+        while self.sym[TOKEN] not in ['then', 'do', ';', 'end', 'else', '.']:
+            if self.sym[SYMBOL] == 'identifier':
+                self.references.add(self.sym[TOKEN])
+                uses |= self.slots.get(self.sym[TOKEN], 0)
+            self.sym = self.get_next_token()
+        return uses
+
+    def check(self, name, tracked, parameter_count):
+        '''Runs both analyses over self.graph and records the warnings.'''
+        graph = self.graph
+        assigned = graph.definitely_assigned()
+        live = graph.live()
+
+        touched = 0
+        for node in range(1, len(graph.defs)):
+            touched |= graph.defs[node] | graph.uses[node]
+
+            # only walk the flagged bits, most nodes have none
+            for i in bits(graph.uses[node] & ~assigned[node]):
+                self.warnings.append((
+                    graph.lines[node],
+                    'Variable `{}` may be used before assignment in {} at line {}.' \
+                    .format(tracked[i][0], name, graph.lines[node])
+                    ))
+            for i in bits(graph.defs[node] & ~live[node]):
+                self.warnings.append((
+                    graph.lines[node],
+                    'Value assigned to `{}` in {} at line {} is never used.' \
+                    .format(tracked[i][0], name, graph.lines[node])
+                    ))
+
+        # parameters come first; only report unused local variables
+        locals_mask = (1 << len(tracked)) - (1 << parameter_count)
+        for i in bits(locals_mask & ~touched):
+            identifier, line = tracked[i]
+            self.warnings.append((
+                line,
+                'Variable `{}` declared in {} at line {} is never used.' \
+                .format(identifier, name, line)
+                ))
+
+#
+# Application entry point
+#
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: python3 dataflow.py <token csv file>')
+        quit()
+
+    analyzer = Analyzer()
+    analyzer.parse_tokens_into_list(sys.argv[1])
+
+    # only lint programs the analyzer accepts; its debug tracing is not
+    # part of the lint output
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            analyzer.start()
+    except Exception as e:
+        print('ERROR: {}'.format(e), file=sys.stderr)
+        sys.exit(2)
+
+    warnings = Lint(analyzer.tokens).run()
+    for line, message in warnings:
+        print(message)
+
+    # non-zero exit status so it can be used as a lint gate
+    if warnings:
+        sys.exit(1)
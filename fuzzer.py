@@ -0,0 +1,429 @@
+import contextlib
+import hashlib
+import math
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from limits import LimitExceeded, Limits
+from metrics import message_type
+from pascalanalyzer import Analyzer
+from pascalparser import SourceIndex, prescan, tokenize
+
+# a slope of log(cost) over log(size) above this is reported as superlinear
+SLOPE_THRESHOLD = 1.5
+
+# recursion findings are reported against the default Python recursion
+# limit; cost curves are measured with a much higher one (on a thread with
+# a big stack), so they can grow to sizes in the thousands
+DEFAULT_RECURSION_LIMIT = sys.getrecursionlimit()
+SWEEP_RECURSION_LIMIT = 100000
+SWEEP_STACK_SIZE = 512 * 1024 * 1024
+
+@contextlib.contextmanager
+def recursion_limit(limit):
+    saved = sys.getrecursionlimit()
+    sys.setrecursionlimit(limit)
+    try:
+        yield
+    finally:
+        sys.setrecursionlimit(saved)
+
+#
+# Running the pipeline
+#
+def analyze(source, limits=None):
+    '''Lexes and analyzes a source text, like run_test.sh does.'''
+    shifts = {}
+    line_starts = []
+    lines = prescan(source, shifts, line_starts)
+    tokens = tokenize(lines, limits, SourceIndex(source, line_starts), shifts)
+    Analyzer(tokens, limits=limits).start()
+
+def run(source, max_seconds):
+    '''Runs the pipeline once and returns its outcome.
+
+    The outcome is None if the program is valid, 'error' for a regular
+    parsing error, 'recursion' if the analyzer ran out of Python stack,
+    'timeout', or the exception itself for anything else (a crash).
+
+    The pipeline gets a thread of its own, so it always starts from the
+    same stack depth and a saved reproducer fails the same way when it is
+    replayed.'''
+    outcome = []
+    thread = threading.Thread(target=lambda: outcome.append(run_here(source, max_seconds)))
+    thread.start()
+    thread.join()
+    return outcome[0]
+
+def run_here(source, max_seconds):
+    '''Does the work of run() on the calling thread.'''
+    try:
+        # the analyzer traces every call to stdout when DEBUG is on
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            analyze(source, Limits(max_seconds=max_seconds))
+    except LimitExceeded as e:
+        return 'recursion' if e.limit == 'recursion' else 'timeout'
+    except Exception as e:
+        # the lexer and analyzer report input errors as plain Exceptions
+        return 'error' if type(e) is Exception else e
+    return None
+
+def measure(source, max_seconds):
+    '''Runs the pipeline once and returns (seconds, outcome).'''
+    start = time.perf_counter()
+    outcome = run(source, max_seconds)
+    return time.perf_counter() - start, outcome
+
+def peak_memory(source, max_seconds):
+    '''Runs the pipeline once under tracemalloc and returns the peak bytes.
+
+    Kept apart from measure() since tracing allocations skews the timing.'''
+    tracemalloc.start()
+    try:
+        run(source, max_seconds)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+#
+# Program generation
+#
+class Generator:
+    '''Generates random programs that follow the grammar the analyzer accepts.'''
+    def __init__(self, rng):
+        self.rng = rng
+
+    def program(self, statements):
+        variables = ['v{}'.format(i) for i in range(self.rng.randint(1, 6))]
+        self.variables = variables
+        procedures = []
+        for i in range(self.rng.randint(0, 3)):
+            procedures.append(
+                'procedure p{}(a: integer);\nbegin\n{}\nend;\n' \
+                .format(i, self.commands(max(1, statements // 4), 2))
+                )
+        return 'program fuzz;\nvar {}: integer;\n{}begin\n{}\nend.\n'.format(
+            ', '.join(variables), ''.join(procedures), self.commands(statements, 3)
+            )
+
+    def commands(self, count, depth):
+        return ';\n'.join(self.command(depth) for i in range(count))
+
+    def command(self, depth):
+        choice = self.rng.randint(0, 5 if depth > 0 else 1)
+        if choice <= 1:
+            return '{} := {}'.format(self.rng.choice(self.variables), self.expression(2))
+        if choice == 2:
+            return 'if {} then {} else {}'.format(
+                self.expression(1), self.command(depth - 1), self.command(depth - 1)
+                )
+        if choice == 3:
+            return 'while {} do {}'.format(self.expression(1), self.command(depth - 1))
+        if choice == 4:
+            return 'begin {} end'.format(self.commands(self.rng.randint(1, 3), depth - 1))
+        return 'if {} then {}'.format(self.expression(1), self.command(depth - 1))
+
+    def expression(self, depth):
+        factor = self.rng.choice(self.variables + ['1', '2.5', 'true', 'false'])
+        if depth <= 0:
+            return factor
+        choice = self.rng.randint(0, 4)
+        if choice == 0:
+            return '({})'.format(self.expression(depth - 1))
+        if choice == 1:
+            operator = self.rng.choice(['+', '-', '*', '/', 'and', 'or'])
+            return '{} {} {}'.format(factor, operator, self.expression(depth - 1))
+        if choice == 2:
+            operator = self.rng.choice(['=', '<', '>', '<=', '>=', '<>'])
+            return '{} {} {}'.format(factor, operator, self.expression(depth - 1))
+        if choice == 3:
+            return 'not {}'.format(factor)
+        return factor
+
+# tokens that mutations can insert
+vocabulary = [
+    'program', 'var', 'integer', 'real', 'boolean', 'procedure', 'begin', 'end',
+    'if', 'then', 'else', 'while', 'do', 'not', ':=', '=', '<', '>', ';', ':', '(',
+    ')', ',', '+', '-', 'or', '*', '/', 'and', '1', '2.5', '.', 'v0', 'x', '{', '}',
+    ]
+
+def mutate(source, rng):
+    '''Deletes, duplicates, replaces or swaps a few whitespace separated tokens.'''
+    words = source.split()
+    for i in range(rng.randint(1, 4)):
+        if not words:
+            break
+        position = rng.randrange(len(words))
+        choice = rng.randint(0, 3)
+        if choice == 0:
+            del words[position]
+        elif choice == 1:
+            words.insert(position, words[position])
+        elif choice == 2:
+            words[position] = rng.choice(vocabulary)
+        elif position + 1 < len(words):
+            words[position], words[position + 1] = words[position + 1], words[position]
+    return ' '.join(words)
+
+# programs parametrized by a size, checked for cost growing faster than linearly
+def nested_if(n):
+    return 'program f; var a: integer; begin {}a := 1{} end.'.format(
+        'if a > 0 then ' * n, ' else a := 2' * n
+        )
+
+def nested_parentheses(n):
+    return 'program f; var a: integer; begin a := {}1{} end.'.format('(' * n, ')' * n)
+
+def nested_begin(n):
+    return 'program f; var a: integer; begin {}a := 1{} end.'.format('begin ' * n, ' end' * n)
+
+def nested_while(n):
+    return 'program f; var a: integer; begin {}a := 1 end.'.format('while a > 0 do ' * n)
+
+def nested_comments(n):
+    return 'program f; {}{} var a: integer; begin a := 1 end.'.format('{' * n, '}' * n)
+
+def long_command_list(n):
+    return 'program f; var a: integer; begin {}a := 1 end.'.format('a := a + 1; ' * n)
+
+def long_expression(n):
+    return 'program f; var a: integer; begin a := 1{} end.'.format(' + a * 2' * n)
+
+def many_procedures(n):
+    return 'program f; var a: integer; {}begin a := 1 end.'.format(
+        ''.join('procedure p{}; begin a := {} end; '.format(i, i) for i in range(n))
+        )
+
+def many_variables(n):
+    return 'program f; var {}: integer; begin v0 := 1 end.'.format(
+        ', '.join('v{}'.format(i) for i in range(n))
+        )
+
+families = [
+    nested_if, nested_parentheses, nested_begin, nested_while, nested_comments,
+    long_command_list, long_expression, many_procedures, many_variables,
+    ]
+
+#
+# Findings
+#
+def slope(sizes, costs):
+    '''Least squares slope of log(cost) over log(size).'''
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(cost, 1e-9)) for cost in costs]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    return numerator / denominator
+
+def check_family(family, max_seconds, budget, start=16, max_size=65536, repeats=2):
+    '''Grows a family by doubling until it fails, reaches max_size or runs
+    out of its time budget, then fits its cost curves.
+
+    The fixed cost of family(1) is subtracted and only the 4 largest sizes
+    are fitted, so small sizes dominated by overhead do not hide the trend.
+    Returns a list of (kind, source, note) findings.'''
+    began = time.perf_counter()
+    with recursion_limit(SWEEP_RECURSION_LIMIT):
+        findings, sizes = sweep(family, max_seconds, budget, start, max_size, repeats, began)
+
+    # sizes that pass with a high recursion limit may not with the default one
+    if sizes:
+        with recursion_limit(DEFAULT_RECURSION_LIMIT):
+            if run(family(sizes[-1]), max_seconds) == 'recursion':
+                smallest = smallest_size(family, sizes[-1], max_seconds, 'recursion')
+                findings.append((
+                    'recursion', family(smallest),
+                    '{}({}) at recursion limit {}'.format(family.__name__, smallest, DEFAULT_RECURSION_LIMIT)
+                    ))
+    return findings
+
+def sweep(family, max_seconds, budget, start, max_size, repeats, began):
+    '''Does the growing for check_family; returns (findings, valid sizes).
+
+    tracemalloc gets very slow on deep stacks, so memory is only measured
+    while its runs fit in half of the budget; timing goes on without it.'''
+    base_time = min(measure(family(1), max_seconds)[0] for j in range(repeats))
+    base_peak = peak_memory(family(1), max_seconds)
+
+    findings = []
+    sizes = []
+    times = []
+    memory_sizes = []
+    peaks = []
+    size = start
+    while size <= max_size:
+        step_began = time.perf_counter()
+        source = family(size)
+        results = [measure(source, max_seconds) for j in range(repeats)]
+        outcome = results[0][1]
+        if outcome is not None:
+            if outcome in ('recursion', 'timeout') or not isinstance(outcome, str):
+                kind = outcome if isinstance(outcome, str) else 'crash'
+                smallest = smallest_size(family, size, max_seconds, outcome)
+                findings.append((kind, family(smallest), '{}({})'.format(family.__name__, smallest)))
+            break
+        sizes.append(size)
+        times.append(max(min(result[0] for result in results) - base_time, 1e-6))
+        step_cost = time.perf_counter() - step_began
+
+        if memory_sizes is not None:
+            memory_began = time.perf_counter()
+            memory_sizes.append(size)
+            peaks.append(max(peak_memory(source, max_seconds) - base_peak, 1))
+            memory_cost = time.perf_counter() - memory_began
+            if time.perf_counter() - began + 2 * memory_cost > budget / 2:
+                findings += fit('superlinear memory', family, memory_sizes, peaks)
+                memory_sizes = None
+
+        # the next size costs at least twice as much; stop if that won't fit
+        if time.perf_counter() - began + 2 * step_cost > budget:
+            break
+        size *= 2
+
+    findings += fit('superlinear time', family, sizes, times)
+    if memory_sizes is not None:
+        findings += fit('superlinear memory', family, memory_sizes, peaks)
+    return findings, sizes
+
+def fit(kind, family, sizes, costs):
+    '''Flags a cost curve whose 4 largest sizes grow faster than linearly.'''
+    if len(sizes) < 3:
+        return []
+    value = slope(sizes[-4:], costs[-4:])
+    if value <= SLOPE_THRESHOLD:
+        return []
+    return [(
+        kind, family(sizes[0]),
+        '{} sizes {} slope {:.2f}'.format(family.__name__, sizes[-4:], value)
+        )]
+
+def same_failure(first, second):
+    if isinstance(first, str) or isinstance(second, str):
+        return first == second
+    return type(first) is type(second) and message_type(first) == message_type(second)
+
+def smallest_size(family, size, max_seconds, outcome):
+    '''Binary searches the smallest size of a family that fails the same way.'''
+    low, high = 1, size
+    while low < high:
+        middle = (low + high) // 2
+        if same_failure(run(family(middle), max_seconds), outcome):
+            high = middle
+        else:
+            low = middle + 1
+    return high
+
+def minimize(source, outcome, max_seconds):
+    '''Removes whitespace separated chunks while the input fails the same way.'''
+    words = source.split()
+    chunk = len(words) // 2
+    while chunk >= 1:
+        position = 0
+        while position < len(words):
+            candidate = words[:position] + words[position + chunk:]
+            if candidate and same_failure(run(' '.join(candidate), max_seconds), outcome):
+                words = candidate
+            else:
+                position += chunk
+        chunk //= 2
+    return ' '.join(words)
+
+def describe(outcome):
+    '''Names an outcome the way .fuzz.out files store it.'''
+    if outcome is None:
+        return 'ok'
+    if isinstance(outcome, str):
+        return outcome
+    return 'crash: {}'.format(message_type(outcome))
+
+def save(directory, kind, source, note, max_seconds):
+    '''Stores a reproducer as a .pas file, named after its contents, and
+    what it does now as a .fuzz.out file next to it.
+
+    run_expected.sh replays every reproducer and diffs its outcome against
+    the .fuzz.out, so a fix or a new failure shows up there; update the
+    .fuzz.out when a fix lands.'''
+    os.makedirs(directory, exist_ok=True)
+    digest = hashlib.sha1(source.encode()).hexdigest()[:10]
+    base = os.path.join(directory, '{}_{}'.format(kind.replace(' ', '_'), digest))
+    # curly brackets would be read as a nested comment
+    note = note.replace('{', '(').replace('}', ')')
+    text = '{{ fuzz: {} - {} }}\n{}\n'.format(kind, note, source)
+    with open(base + '.pas', 'w') as file:
+        file.write(text)
+    with open(base + '.fuzz.out', 'w') as file:
+        file.write(describe(run(text, max_seconds)) + '\n')
+    return base + '.pas'
+
+#
+# Application entry point
+#
+def main():
+    seed = 0
+    iterations = 200
+    directory = os.path.join('tests', 'regressions')
+    max_seconds = 5.0
+    budget = 30.0 # seconds spent growing each family
+    if '--seed' in sys.argv:
+        seed = int(sys.argv[sys.argv.index('--seed') + 1])
+    if '--iterations' in sys.argv:
+        iterations = int(sys.argv[sys.argv.index('--iterations') + 1])
+    if '--output' in sys.argv:
+        directory = sys.argv[sys.argv.index('--output') + 1]
+    if '--max-seconds' in sys.argv:
+        max_seconds = float(sys.argv[sys.argv.index('--max-seconds') + 1])
+    if '--budget' in sys.argv:
+        budget = float(sys.argv[sys.argv.index('--budget') + 1])
+
+    # --replay FILE prints the outcome of a saved reproducer, as in its .fuzz.out
+    if '--replay' in sys.argv:
+        with open(sys.argv[sys.argv.index('--replay') + 1], 'r') as file:
+            print(describe(run(file.read(), max_seconds)))
+        return []
+
+    rng = random.Random(seed)
+    generator = Generator(rng)
+    findings = []
+
+    # cost curves of the size parametrized families
+    for family in families:
+        findings += check_family(family, max_seconds, budget)
+
+    # random valid programs, then mutations of them, looking for crashes
+    seen = set()
+    for i in range(iterations):
+        source = generator.program(rng.randint(1, 20))
+        if i % 2:
+            source = mutate(source, rng)
+        outcome = run(source, max_seconds)
+        if outcome is None or outcome == 'error':
+            continue
+
+        kind = outcome if isinstance(outcome, str) else 'crash'
+        key = kind if isinstance(outcome, str) else message_type(outcome)
+        if key in seen:
+            continue
+        seen.add(key)
+        findings.append((kind, minimize(source, outcome, max_seconds), str(key)))
+
+    for kind, source, note in findings:
+        print('{}: {} -> {}'.format(kind, note, save(directory, kind, source, note, max_seconds)))
+
+    return findings
+
+if __name__ == '__main__':
+    # deep recursion needs a bigger C stack than the main thread has
+    threading.stack_size(SWEEP_STACK_SIZE)
+    results = []
+    thread = threading.Thread(target=lambda: results.append(main()))
+    thread.start()
+    thread.join()
+
+    if not results or results[0]:
+        sys.exit(1)
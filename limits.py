@@ -0,0 +1,91 @@
+import sys
+import time
+
+class LimitExceeded(Exception):
+    '''Raised when an input goes over one of the configured resource limits.
+
+    `limit` is the name of the limit, `value` the amount reached and
+    `maximum` the configured bound, so callers can tell it apart from a
+    regular parsing error and reject or deprioritize the job.'''
+    def __init__(self, limit, value, maximum):
+        super(LimitExceeded, self).__init__(
+            '{} limit exceeded: {} > {}'.format(limit, value, maximum)
+            )
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+
+    def __reduce__(self):
+        # keep the structured fields when sent back from worker processes
+        return (LimitExceeded, (self.limit, self.value, self.maximum), self.__dict__)
+
+class Limits:
+    '''Resource limits for untrusted inputs. A limit set to None is disabled.'''
+    def __init__(self, max_bytes=None, max_tokens=None, max_depth=None,
+                 max_ids_per_scope=None, max_seconds=None):
+        self.max_bytes = max_bytes
+        self.max_tokens = max_tokens
+        self.max_depth = max_depth
+        self.max_ids_per_scope = max_ids_per_scope
+        self.max_seconds = max_seconds
+        self.deadline = None
+
+    def start(self):
+        '''Starts the wall-clock timer of an analysis, if there is a time limit.
+
+        Every lexer run and analysis gets its own budget; --jobs workers keep
+        the deadline of the analysis that started them.'''
+        if self.max_seconds is not None:
+            self.deadline = time.monotonic() + self.max_seconds
+
+    def check(self, limit, value):
+        '''Raises LimitExceeded if `value` is over the `limit` bound.'''
+        maximum = getattr(self, limit)
+        if maximum is not None and value > maximum:
+            raise LimitExceeded(limit, value, maximum)
+
+    def check_time(self):
+        '''Raises LimitExceeded if the time limit has passed.'''
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            elapsed = time.monotonic() - self.deadline + self.max_seconds
+            raise LimitExceeded('max_seconds', round(elapsed, 3), self.max_seconds)
+
+def recursion_exceeded(error):
+    '''Turns a RecursionError into a LimitExceeded on the Python call depth.
+
+    A RecursionError means the interpreter's call depth went past
+    sys.getrecursionlimit(), so that is what value > maximum states. The
+    depth counts C calls too, so the Python frames actually on the stack,
+    counted from the traceback and the frames below it, are kept apart in
+    the `frames` attribute.'''
+    frames = 0
+    traceback = error.__traceback__
+    frame = traceback.tb_frame.f_back if traceback is not None else None
+    while traceback is not None:
+        frames += 1
+        traceback = traceback.tb_next
+    while frame is not None:
+        frames += 1
+        frame = frame.f_back
+
+    limit = sys.getrecursionlimit()
+    exceeded = LimitExceeded('recursion', limit + 1, limit)
+    exceeded.frames = frames
+    return exceeded
+
+# command line flag -> (Limits attribute, value type)
+flags = {
+    '--max-bytes': ('max_bytes', int),
+    '--max-tokens': ('max_tokens', int),
+    '--max-depth': ('max_depth', int),
+    '--max-ids': ('max_ids_per_scope', int),
+    '--max-seconds': ('max_seconds', float),
+    }
+
+def parse_limits(argv):
+    '''Builds a Limits object from `--max-* N` command line flags.'''
+    limits = Limits()
+    for flag, (attribute, value_type) in flags.items():
+        if flag in argv:
+            setattr(limits, attribute, value_type(argv[argv.index(flag) + 1]))
+    return limits
@@ -0,0 +1,145 @@
+import bisect
+import functools
+import json
+import re
+import time
+
+# default latency buckets, in seconds
+LATENCY_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, 5, 10)
+
+class Counter:
+    '''Monotonic counter, optionally split by label values.'''
+    def __init__(self, name, description):
+        self.name = name
+        self.description = description
+        self.values = {} # sorted label tuple -> value
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def prometheus(self):
+        lines = [
+            '# HELP {} {}'.format(self.name, self.description),
+            '# TYPE {} counter'.format(self.name),
+            ]
+        for key, value in sorted(self.values.items()):
+            lines.append('{}{} {}'.format(self.name, format_labels(key), value))
+        return lines
+
+    def snapshot(self):
+        return [{'labels': dict(key), 'value': value} for key, value in sorted(self.values.items())]
+
+class Histogram:
+    '''Histogram with fixed upper bounds, in the Prometheus sense.'''
+    def __init__(self, name, description, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1) # last one is +Inf
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def prometheus(self):
+        lines = [
+            '# HELP {} {}'.format(self.name, self.description),
+            '# TYPE {} histogram'.format(self.name),
+            ]
+        cumulative = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            cumulative += count
+            lines.append('{}_bucket{{le="{}"}} {}'.format(self.name, bound, cumulative))
+        lines.append('{}_sum {}'.format(self.name, self.sum))
+        lines.append('{}_count {}'.format(self.name, self.count))
+        return lines
+
+    def snapshot(self):
+        return {
+            'buckets': [[bound, count] for bound, count in zip(self.buckets + ('+Inf',), self.counts)],
+            'sum': self.sum,
+            'count': self.count,
+            }
+
+class Registry:
+    '''Keeps every metric of the process, by name.'''
+    def __init__(self):
+        self.metrics = {}
+
+    def counter(self, name, description):
+        if name not in self.metrics:
+            self.metrics[name] = Counter(name, description)
+        return self.metrics[name]
+
+    def histogram(self, name, description, buckets=LATENCY_BUCKETS):
+        if name not in self.metrics:
+            self.metrics[name] = Histogram(name, description, buckets)
+        return self.metrics[name]
+
+    def prometheus(self):
+        '''Returns all metrics in the Prometheus text exposition format.'''
+        lines = []
+        for name in sorted(self.metrics):
+            lines += self.metrics[name].prometheus()
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        '''Returns all metrics as a JSON serializable dict.'''
+        return {name: self.metrics[name].snapshot() for name in sorted(self.metrics)}
+
+    def write(self, filename):
+        '''Dumps the metrics to a file, as JSON if it ends in .json.'''
+        with open(filename, 'w') as file:
+            if filename.endswith('.json'):
+                json.dump(self.snapshot(), file, indent=2)
+            else:
+                file.write(self.prometheus())
+
+def format_labels(key):
+    if not key:
+        return ''
+    escaped = []
+    for label, value in key:
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        escaped.append('{}="{}"'.format(label, value))
+    return '{' + ','.join(escaped) + '}'
+
+def message_type(error):
+    '''Reduces an error to its message template, so it can be used as a label.
+
+    `abc` quoted names and numbers are replaced, e.g. "Missing ; at line 3"
+    becomes "Missing ; at line N".'''
+    message = str(error).split('\n')[0]
+    message = re.sub(r'`[^`]*`', '`_`', message)
+    message = re.sub(r'[0-9]+(\.[0-9]+)?', 'N', message)
+    return '{}: {}'.format(type(error).__name__, message)
+
+# process wide registry
+registry = Registry()
+
+def timed(stage):
+    '''Decorator that records the latency, calls and errors of a stage.'''
+    latency = registry.histogram(
+        'pascal_{}_seconds'.format(stage), 'Time spent in {}.'.format(stage)
+        )
+    calls = registry.counter('pascal_{}_total'.format(stage), 'Calls to {}.'.format(stage))
+    errors = registry.counter('pascal_errors_total', 'Errors raised, by stage and message type.')
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                errors.inc(stage=stage, type=message_type(e))
+                raise
+            finally:
+                latency.observe(time.perf_counter() - start)
+                calls.inc()
+        return wrapper
+    return decorator
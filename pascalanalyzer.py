@@ -1,11 +1,18 @@
+import contextlib
 import csv
+import multiprocessing
 import sys
 
+from limits import LimitExceeded, Limits, parse_limits, recursion_exceeded
+from metrics import registry, timed
+
 DEBUG = 1
 
 TOKEN = 0  # literal contents of symbol
 SYMBOL = 1 # type of symbol
 LINE = 2   # line at which symbol was found
+COLUMN = 3 # column at which symbol was found (if the lexer recorded it)
+OFFSET = 4 # character offset of symbol in the source (if the lexer recorded it)
 
 class BailoutException(Exception):
     '''Exception type that does not necessarily imply parsing error.'''
@@ -36,49 +43,90 @@ def methodwrapper(func):
 
 class ScopeStack:
     '''Stack class for scope management.'''
-    def __init__(self):
+    def __init__(self, limits=None):
         self.mark = ['@']
         self._stack = []
+        self._counts = {} # identifier -> how many times it is in the stack
+        self._scope_sizes = [] # identifiers declared in each open scope
+        self.outer = {} # identifier -> order of top-level procedures declared outside the stack
+        self.outer_end = 0 # outer procedures before this one are visible
+        self.max_depth = 0 # deepest scope nesting seen
+        self.limits = limits if limits is not None else Limits()
 
     def new_scope(self):
         '''Inserts a scope marking in the stack.'''
+        self._scope_sizes.append(0)
+        self.limits.check('max_depth', len(self._scope_sizes))
+        self.max_depth = max(self.max_depth, len(self._scope_sizes))
         self._stack.append(self.mark)
 
+    def load(self, stack):
+        '''Replaces the stack, e.g. with a snapshot of the global scope.'''
+        self._stack = list(stack)
+        self._counts = {}
+        for i in self._stack:
+            if i != self.mark:
+                self._counts[i[0]] = self._counts.get(i[0], 0) + 1
+        self._scope_sizes = [len(self._stack) - 1]
+
+    def exists(self, identifier):
+        '''Whether an identifier is anywhere in the stack.'''
+        if self._counts.get(identifier):
+            return True
+        return self.outer.get(identifier, self.outer_end) < self.outer_end
+
     def create_id(self, identifier, identifier_type):
         '''Tries to create an identifier.'''
-        for i in self._stack[::-1]:
-            if i[0] == self.mark:
-                break
-            if i[0] == identifier:
-                raise Exception(
-                    'Tried to redefine already existing identifier `{}`.' \
-                    .format(identifier)
-                    )
+        if self.exists(identifier):
+            raise Exception(
+                'Tried to redefine already existing identifier `{}`.' \
+                .format(identifier)
+                )
 
+        if self._scope_sizes:
+            self._scope_sizes[-1] += 1
+            self.limits.check('max_ids_per_scope', self._scope_sizes[-1])
         self._stack.append((identifier, identifier_type))
+        self._counts[identifier] = self._counts.get(identifier, 0) + 1
 
     def search(self, identifier):
         '''Looks for an identifier.'''
-        for i in self._stack[::-1]:
-            if i[0] == identifier:
-                return True
+        if self.exists(identifier):
+            return True
         raise Exception('Identifier `{}` was used before declaration.'.format(identifier))
 
     def end_scope(self):
         '''Leaves the current scope.'''
         self._stack.reverse()
-        self._stack = self._stack[self._stack.index(self.mark)+1:]
+        mark = self._stack.index(self.mark)
+        for i in self._stack[:mark]:
+            self._counts[i[0]] -= 1
+        self._stack = self._stack[mark+1:]
         self._stack.reverse()
+        self._scope_sizes.pop()
+
+scope_depth_histogram = registry.histogram(
+    'pascal_scope_depth', 'Deepest scope stack nesting per analysis.',
+    buckets=(1, 2, 4, 8, 16, 32, 64)
+    )
+analyzed_tokens = registry.counter('pascal_analyzed_tokens_total', 'Tokens consumed by the analyzer.')
 
 #
 # Analyzer
 #
 class Analyzer:
-    file = None # Input file handle
-    tokens = [] # Token list
-    counter = 0 # "Current token" counter
-    sym = None
-    scope_stack = ScopeStack()
+    def __init__(self, tokens=None, jobs=None, limits=None):
+        self.file = None # Input file handle
+        self.tokens = tokens if tokens is not None else [] # Token list
+        self.counter = 0 # "Current token" counter
+        self.sym = None
+        self.limits = limits if limits is not None else Limits()
+        self.scope_stack = ScopeStack(self.limits)
+        self.depth = 0 # Parenthesis nesting depth
+        self.jobs = jobs # Worker processes for top-level procedures (None = sequential)
+        self.signatures = {} # Procedure name -> tuple of parameter types
+        self.skim = False # Skip procedure and program bodies (outline mode)
+        self.index = None # Declarations found, as (identifier, type, line, depth)
 
     def parse_tokens_into_list(self, filename):
         '''Parse tokens from input CSV file to token list.'''
@@ -86,29 +134,88 @@ class Analyzer:
             reader = csv.reader(file)
 
             line = next(reader)
-            if line != ['token', 'classification', 'line']:
+            if line == ['token', 'classification', 'line']:
+                positions = False
+            elif line == ['token', 'classification', 'line', 'column', 'offset']:
+                positions = True
+            else:
                 print('ERROR: Not a valid input file.')
                 quit()
 
             for row in reader:
-                self.tokens.append((row[0], row[1], row[2].strip()))
+                if positions:
+                    self.tokens.append((row[0], row[1], row[2], int(row[3]), int(row[4])))
+                else:
+                    self.tokens.append((row[0], row[1], row[2].strip()))
+                self.limits.check('max_tokens', len(self.tokens))
 
     def get_next_token(self):
-        '''Returns next token in a (token, identifier, line) tuple.'''
+        '''Returns next token in a (token, identifier, line[, column, offset]) tuple.'''
         token = self.tokens[self.counter]
         self.counter += 1
 
+        # resource limits: parenthesis depth always, the clock every 1024 tokens
+        if token[TOKEN] == '(':
+            self.depth += 1
+            self.limits.check('max_depth', self.depth)
+        elif token[TOKEN] == ')':
+            self.depth -= 1
+        if not self.counter & 1023:
+            self.limits.check_time()
+
         if DEBUG > 1:
             print(token)
 
         return token
 
+    def outline(self):
+        '''Indexes declarations without parsing any begin ... end body.
+
+        Returns the (identifier, type, line, depth) of the program name,
+        variables, parameters and procedures, where depth 1 is global scope.
+        Outline mode always runs sequentially.'''
+        self.skim = True
+        self.jobs = None
+        self.index = []
+        self.start()
+        return self.index
+
+    def position(self):
+        '''Returns the (line, column, offset) of the current symbol.
+
+        Column and offset are None if the tokens do not carry them.'''
+        if len(self.sym) > OFFSET:
+            return int(self.sym[LINE]), self.sym[COLUMN], self.sym[OFFSET]
+        return int(self.sym[LINE]), None, None
+
+    def record(self, identifier, identifier_type, line):
+        '''Adds a declaration to the index, if one is being built.'''
+        if self.index is not None:
+            self.index.append((identifier, identifier_type, line, len(self.scope_stack._scope_sizes)))
+
+    @timed('analyze')
     def start(self):
         '''Read first program token and fire off recursive calls.'''
+        self.limits.start()
         self.sym = self.get_next_token()
         if self.sym[TOKEN] == 'program':
             self.scope_stack.new_scope()
-            self.program()
+            try:
+                self.program()
+            except RecursionError as e:
+                # too deep for the recursive descent, whatever max_depth says
+                raise recursion_exceeded(e)
+            except Exception as e:
+                # let callers locate the error without rescanning the source;
+                # errors merged from --jobs workers already carry a position
+                # per diagnostic
+                if not hasattr(e, 'positions'):
+                    e.position = self.position()
+                    e.positions = [e.position]
+                raise
+            finally:
+                scope_depth_histogram.observe(self.scope_stack.max_depth)
+                analyzed_tokens.inc(self.counter)
         else:
             raise Exception(
                 'Program did not start with program keyword. Started with {} instead.' \
@@ -124,6 +231,7 @@ class Analyzer:
         self.sym = self.get_next_token()
         if self.sym[SYMBOL] == 'identifier':
             self.scope_stack.create_id(self.sym[TOKEN], 'program_declaration') #TODO look for a right name
+            self.record(self.sym[TOKEN], 'program', self.sym[LINE])
         else:
             raise Exception(
                 'Error parsing {} at line {}: missing program name identifier.' \
@@ -139,7 +247,7 @@ class Analyzer:
         self.sym = self.get_next_token()
         self.var_declarations()
         self.subprogram_declarations()
-        self.compound_command()
+        self.body()
 
         if self.sym[TOKEN] != '.':
             raise Exception('File did not end with a `.`!')
@@ -156,6 +264,7 @@ class Analyzer:
     @methodwrapper
     def list_of_var_declarations(self):
         # list_of_ids: type; list_of_var_declarations_l
+        line = self.sym[LINE]
         list_ids = self.list_of_ids()
 
         if self.sym[TOKEN] != ':':
@@ -167,6 +276,7 @@ class Analyzer:
 
         for i in list_ids:
             self.scope_stack.create_id(i, aux_type)
+            self.record(i, aux_type, line)
 
         if self.sym[TOKEN] != ';':
             raise Exception('Missing ; at line {}'.format(self.sym[LINE]))
@@ -178,6 +288,7 @@ class Analyzer:
     @methodwrapper
     def list_of_var_declarations_l(self):
         # list_of_ids: type; list_of_var_declarations_l | <empty>
+        line = self.sym[LINE]
         try:
             list_ids = self.list_of_ids()
         except BailoutException:
@@ -193,6 +304,7 @@ class Analyzer:
 
         for i in list_ids:
             self.scope_stack.create_id(i, aux_type)
+            self.record(i, aux_type, line)
 
         if self.sym[TOKEN] != ';':
             raise Exception('Missing ; at line {}'.format(self.sym[LINE]))
@@ -241,27 +353,153 @@ class Analyzer:
     @methodwrapper
     def subprogram_declarations(self):
         # subprogram_declarations_l
+        if self.jobs is not None:
+            self.parallel_subprogram_declarations()
+        else:
+            self.subprogram_declarations_l()
+
+
+    def parallel_subprogram_declarations(self):
+        '''Analyzes top-level procedures in worker processes.
+
+        A boundary scan splits the token list at each top-level
+        `procedure ... ;` unit, then every unit body is checked in parallel
+        against a snapshot of the global scope. Diagnostics are reported in
+        source order. If the scan or a worker finds that the units do not
+        split where the grammar would, the procedures are analyzed
+        sequentially instead, so both modes report the same first error.'''
+        scan = self.scan_subprograms(self.counter - 1)
+        if scan is None:
+            self.sequential_subprogram_declarations()
+            return
+        units, index = scan
+        if not units:
+            return
+
+        # each unit sees the globals plus every procedure declared before it.
+        # those are sent once per worker; units only carry their tokens and
+        # how many procedures come before them
+        names = {}
+        for i, (start, end) in enumerate(units):
+            names.setdefault(self.tokens[start + 1][TOKEN], i)
+        work = [(self.tokens[start:end], i) for i, (start, end) in enumerate(units)]
+
+        with multiprocessing.Pool(
+                self.jobs or None,
+                initializer=init_worker,
+                initargs=(self.scope_stack._stack, names, self.limits)
+                ) as pool:
+            results = pool.map(analyze_subprogram, work, chunksize=max(1, len(work) // 64))
+
+        if any(error is False for error in results):
+            self.sequential_subprogram_declarations()
+            return
+
+        for error in results:
+            if isinstance(error, LimitExceeded):
+                raise error
+
+        errors = [error for error in results if error is not None]
+        if errors:
+            merged = Exception('\n'.join(message for message, position in errors))
+            merged.positions = [position for message, position in errors]
+            merged.position = merged.positions[0]
+            raise merged
+
+        for start, end in units:
+            name = self.tokens[start + 1][TOKEN]
+            self.scope_stack.create_id(name, 'proc')
+            self.signatures[name] = self.signature(start)
+
+        self.counter = index
+        self.sym = self.get_next_token()
+
+
+    def sequential_subprogram_declarations(self):
+        '''Fallback of parallel_subprogram_declarations for units that do not
+        split cleanly; nested procedures are not sent to workers either.'''
+        self.jobs = None
         self.subprogram_declarations_l()
 
 
+    def scan_subprograms(self, index):
+        '''Finds the (start, end) token ranges of top-level procedures.
+
+        Only `procedure`, `begin`, `end` and `;` are looked at: every `begin`
+        at depth 0 opens the body of the innermost pending procedure, and the
+        matching `end`, followed by `;`, closes it. Returns the ranges and
+        the index of the first token after them, or None if the tokens do
+        not split cleanly (a procedure left open, an `end` without its
+        `begin` or a unit not followed by `;`).'''
+        units = []
+        while index < len(self.tokens) and self.tokens[index][TOKEN] == 'procedure':
+            start = index
+            pending = 0
+            depth = 0
+            while True:
+                if index >= len(self.tokens):
+                    return None
+                token = self.tokens[index][TOKEN]
+                index += 1
+                if token == 'procedure':
+                    pending += 1
+                elif token == 'begin':
+                    depth += 1
+                elif token == 'end':
+                    depth -= 1
+                    if depth < 0:
+                        return None
+                    if depth == 0:
+                        pending -= 1
+                        if pending == 0:
+                            break
+
+            # unit includes the ; that follows its end
+            if index >= len(self.tokens) or self.tokens[index][TOKEN] != ';':
+                return None
+            index += 1
+            units.append((start, index))
+        return units, index
+
+
+    def signature(self, start):
+        '''Returns the parameter types of the procedure starting at `start`.'''
+        types = []
+        index = start + 2
+        if index >= len(self.tokens) or self.tokens[index][TOKEN] != '(':
+            return tuple(types)
+
+        count = 0
+        while index < len(self.tokens) and self.tokens[index][TOKEN] != ')':
+            if self.tokens[index][SYMBOL] == 'identifier':
+                count += 1
+            elif self.tokens[index][TOKEN] in ['integer', 'real', 'boolean']:
+                types += [self.tokens[index][TOKEN]] * count
+                count = 0
+            index += 1
+        return tuple(types)
+
+
     @methodwrapper
     def subprogram_declarations_l(self):
         # subprogram_declaration; subprogram_declarations_l | <empty>
-        try:
-            self.subprogram_declaration()
-        except BailoutException:
-            # if there's no procedure keyword, bail out since it's optional
-            return
+        # walked in a loop rather than one call per declaration, so files with
+        # thousands of procedures don't run out of Python stack
+        while True:
+            try:
+                self.subprogram_declaration()
+            except BailoutException:
+                # if there's no procedure keyword, bail out since it's optional
+                return
 
-        # TODO: should this throw an exception or just ignore since it's
-        # technically optional? test carefully later
-        if self.sym[TOKEN] != ';':
-            raise Exception(
-                'Expected ; at line {}, got {} instead.'.format(self.sym[LINE], self.sym[TOKEN])
-                )
+            # TODO: should this throw an exception or just ignore since it's
+            # technically optional? test carefully later
+            if self.sym[TOKEN] != ';':
+                raise Exception(
+                    'Expected ; at line {}, got {} instead.'.format(self.sym[LINE], self.sym[TOKEN])
+                    )
 
-        self.sym = self.get_next_token()
-        self.subprogram_declarations_l()
+            self.sym = self.get_next_token()
 
 
     @methodwrapper
@@ -279,6 +517,12 @@ class Analyzer:
         self.sym = self.get_next_token()
         if self.sym[SYMBOL] == 'identifier':
             self.scope_stack.create_id(self.sym[TOKEN], 'proc')
+            self.signatures[self.sym[TOKEN]] = self.signature(self.counter - 2)
+            self.record(
+                self.sym[TOKEN],
+                'proc({})'.format(','.join(self.signatures[self.sym[TOKEN]])),
+                self.sym[LINE]
+                )
             self.scope_stack.new_scope()
         else:
             raise Exception(
@@ -298,7 +542,7 @@ class Analyzer:
         self.sym = self.get_next_token()
         self.var_declarations()
         self.subprogram_declarations()
-        self.compound_command()
+        self.body()
 
         self.scope_stack.end_scope()
 
@@ -324,6 +568,7 @@ class Analyzer:
     @methodwrapper
     def list_of_parameters(self):
         # list_of_ids: type list_of_parameters_l
+        line = self.sym[LINE]
         aux_ids = self.list_of_ids()
 
         if self.sym[TOKEN] != ':':
@@ -335,6 +580,7 @@ class Analyzer:
 
         for identifier in aux_ids:
             self.scope_stack.create_id(identifier, aux_type)
+            self.record(identifier, aux_type, line)
 
         self.list_of_parameters_l()
 
@@ -346,6 +592,7 @@ class Analyzer:
             return [] # multiple parameters are optional, bail out if there's no ;
 
         self.sym = self.get_next_token()
+        line = self.sym[LINE]
         aux_ids = self.list_of_ids()
 
         if self.sym[TOKEN] != ':':
@@ -357,10 +604,48 @@ class Analyzer:
 
         for identifier in aux_ids:
            self.scope_stack.create_id(identifier, aux_type)
+           self.record(identifier, aux_type, line)
 
         self.list_of_parameters_l()
 
 
+    @methodwrapper
+    def body(self):
+        # compound_command, skipped over in outline mode
+        if self.skim:
+            self.skip_compound_command()
+        else:
+            self.compound_command()
+
+
+    @methodwrapper
+    def skip_compound_command(self):
+        # begin ... end, matched by depth without parsing the commands
+        if self.sym[TOKEN] != 'begin':
+            raise Exception(
+                'Expected begin at line {}, got {} instead' \
+                .format(self.sym[LINE], self.sym[TOKEN])
+                )
+
+        index = self.counter - 1
+        depth = 0
+        while True:
+            if index >= len(self.tokens):
+                raise Exception('Unterminated begin at line {}.'.format(self.sym[LINE]))
+            token = self.tokens[index][TOKEN]
+            index += 1
+            if token == 'begin':
+                depth += 1
+            elif token == 'end':
+                depth -= 1
+                if depth == 0:
+                    break
+
+        self.limits.check_time()
+        self.counter = index
+        self.sym = self.get_next_token()
+
+
     @methodwrapper
     def compound_command(self):
         # begin
@@ -694,14 +979,83 @@ class Analyzer:
         self.sym = self.get_next_token()
 
 
+# state shared by every unit a worker process analyzes, set by init_worker
+worker_scope = None
+worker_procedures = None
+worker_limits = None
+
+def init_worker(global_scope, procedures, limits):
+    '''Worker initializer: keeps the global scope, the order in which each
+    top-level procedure is first declared and the limits.'''
+    global worker_scope, worker_procedures, worker_limits
+    worker_scope = global_scope
+    worker_procedures = procedures
+    worker_limits = limits
+
+def analyze_subprogram(unit):
+    '''Worker entry point: analyzes a single top-level procedure.
+
+    Returns the error message and the (line, column, offset) of the symbol
+    it was raised at, a LimitExceeded, None if the procedure is valid, or False if it does not end at the end of its unit: the boundary
+    scan split it somewhere the grammar does not.'''
+    tokens, position = unit
+    analyzer = Analyzer(tokens, limits=worker_limits)
+    analyzer.scope_stack.load(worker_scope)
+    analyzer.scope_stack.outer = worker_procedures
+    analyzer.scope_stack.outer_end = position
+    analyzer.scope_stack._scope_sizes[0] += position
+    try:
+        analyzer.sym = analyzer.get_next_token()
+        analyzer.subprogram_declaration()
+        if analyzer.sym[TOKEN] != ';':
+            raise Exception(
+                'Expected ; at line {}, got {} instead.' \
+                .format(analyzer.sym[LINE], analyzer.sym[TOKEN])
+                )
+        if analyzer.counter != len(tokens):
+            return False
+    except IndexError:
+        # ran into the tokens of the next unit
+        return False
+    except RecursionError as e:
+        return recursion_exceeded(e)
+    except LimitExceeded as e:
+        return e
+    except Exception as e:
+        return str(e), analyzer.position()
+    return None
+
 #
 # Application entry point
 #
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print('Usage: python3 pascalanalyzer.py <token csv file>')
+        print('Usage: python3 pascalanalyzer.py <token csv file> [--outline] [--jobs N] [--max-tokens N] '
+              '[--max-depth N] [--max-ids N] [--max-seconds S] [--metrics FILE]')
         quit()
 
-    analyzer = Analyzer()
-    analyzer.parse_tokens_into_list(sys.argv[1])
-    analyzer.start()
+    # --jobs N analyzes top-level procedures on N processes (0 = all cores)
+    jobs = None
+    if '--jobs' in sys.argv:
+        jobs = int(sys.argv[sys.argv.index('--jobs') + 1])
+
+    analyzer = Analyzer(jobs=jobs, limits=parse_limits(sys.argv[2:]))
+    try:
+        analyzer.parse_tokens_into_list(sys.argv[1])
+        if '--outline' in sys.argv:
+            # --outline prints the declaration index instead of analyzing the
+            # bodies; debug tracing goes to stderr so stdout stays valid CSV
+            with contextlib.redirect_stdout(sys.stderr):
+                index = analyzer.outline()
+            print('identifier,type,line,depth')
+            for declaration in index:
+                print('{},"{}",{},{}'.format(*declaration))
+        else:
+            analyzer.start()
+    except LimitExceeded as e:
+        print('ERROR: {}'.format(e), file=sys.stderr)
+        sys.exit(2)
+    finally:
+        # --metrics FILE dumps the metrics, as JSON if FILE ends in .json
+        if '--metrics' in sys.argv:
+            registry.write(sys.argv[sys.argv.index('--metrics') + 1])
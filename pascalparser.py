@@ -1,39 +1,156 @@
+import bisect
+import os
 import re
 import sys
+from array import array
+
+from limits import LimitExceeded, parse_limits
+from metrics import registry, timed
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# line breaks are kept in the text as read (\r\n, \n or a lone \r), so
+# offsets count every character of the file
+line_break = re.compile(r'\r\n?|\n')
+
+# checks that the comment brackets are balanced and removes the comments,
+# in one pass over the whole text. returns the lines without comments and
+# raises an Exception if a bracket is closed before it's opened or left
+# open. uses NumPy for ASCII sources when it's installed. if a shifts dict
+# is given, lines that had comments removed get a list of (column in
+# cleaned line, columns removed before it) entries, so columns can be mapped
+# back to the original line. if a line_starts list is given, it gets the
+# offsets at which lines start, ready for SourceIndex
+@timed('prescan')
+def prescan(code, shifts=None, line_starts=None):
+
+    if numpy is not None and code.isascii():
+        slices, starts = scan_numpy(code)
+    else:
+        slices, starts = scan_python(code)
+
+    if line_starts is not None:
+        line_starts.extend(starts)
+    if starts[-1] == len(code):
+        starts.pop() # no line after a trailing newline
+
+    # cut the non-comment slices at line boundaries and glue them per line
+    code_list = []
+    position = 0
+    for line_num, line_start in enumerate(starts):
+        line_end = starts[line_num + 1] if line_num + 1 < len(starts) else len(code)
+
+        if position < len(slices):
+            start, end = slices[position]
+            if start <= line_start and end >= line_end:
+                # no comment in this line
+                code_list.append(code[line_start:line_end])
+                if end == line_end:
+                    position += 1
+                continue
 
-# counts the brackets and raises an Exception if something get wrong
-def check_brackets(code):
+        l = ""
+        line_shifts = [(0, 0)]
+        while position < len(slices) and slices[position][0] < line_end:
+            start, end = slices[position]
+            start = max(start, line_start)
+            if start - line_start != len(l):
+                line_shifts.append((len(l), start - line_start - len(l)))
+            l += code[start:min(end, line_end)]
+            if end > line_end:
+                break # slice goes on in the next line
+            position += 1
+
+        if shifts is not None and len(line_shifts) > 1:
+            shifts[line_num] = line_shifts
+        code_list.append(l)
+    return code_list
 
-    open_brackets = 0
+# returns the (start, end) slices of code outside comments and the offsets at
+# which lines start. {, } and newlines are found with vectorized comparisons;
+# the comment depth of the text between two brackets is the cumulative sum of
+# +1/-1 over the brackets before it
+def scan_numpy(code):
+
+    data = numpy.frombuffer(code.encode('ascii'), dtype=numpy.uint8)
+    positions = numpy.flatnonzero((data == ord('{')) | (data == ord('}')))
+    steps = numpy.where(data[positions] == ord('{'), 1, -1)
+    depth = numpy.cumsum(steps, dtype=numpy.int64)
+
+    # gap i is the text before bracket i (the last one runs to the end of the code)
+    gap_starts = numpy.concatenate(([0], positions + 1))
+    gap_ends = numpy.concatenate((positions, [len(data)]))
+    gap_depths = numpy.concatenate(([0], depth))
+    gaps = gap_ends > gap_starts
+
+    if numpy.any(gaps & (gap_depths < 0)):
+        raise Exception("Brackets Error")
+    if len(depth) and depth[-1] != 0:
+        raise Exception("the brackets are not closed")
+
+    kept = gaps & (gap_depths == 0)
+    slices = list(zip(gap_starts[kept].tolist(), gap_ends[kept].tolist()))
 
-    for char in code:
-        if char == "{":
-            open_brackets += 1
-        elif char == "}":
-            open_brackets -= 1
-        elif open_brackets < 0:
+    # a \r ends a line unless it is the first half of a \r\n
+    ends = data == ord('\n')
+    carriage_returns = data == ord('\r')
+    ends[:-1] |= carriage_returns[:-1] & ~ends[1:]
+    ends[-1:] |= carriage_returns[-1:]
+    line_starts = [0] + (numpy.flatnonzero(ends) + 1).tolist()
+    return slices, line_starts
+
+# pure Python fallback of scan_numpy: only looks at bracket positions
+def scan_python(code):
+
+    open_brackets = 0
+    slices = []
+    start = 0 # end of the last bracket
+
+    for match in re.finditer(r'[{}]', code):
+        if match.start() > start:
+            # characters between two brackets
+            if open_brackets < 0:
+                raise Exception("Brackets Error")
+            if open_brackets == 0:
+                slices.append((start, match.start()))
+        open_brackets += 1 if match.group(0) == "{" else -1
+        start = match.end()
+
+    if len(code) > start:
+        if open_brackets < 0:
             raise Exception("Brackets Error")
+        if open_brackets == 0:
+            slices.append((start, len(code)))
 
     if open_brackets != 0:
         raise Exception("the brackets are not closed")
 
-def remove_comments(lines):
+    line_starts = [0] + [match.end() for match in line_break.finditer(code)]
+    return slices, line_starts
 
-    open_brackets = 0
+# maps character offsets in a source text to (line, column) and back, using
+# a binary search over the offsets at which each line starts. those can be
+# given when already known (prescan finds them), instead of scanning the text
+class SourceIndex:
 
-    code_list = []
-    for line in lines:
-        l = ""
-        for char in line:
-            if char == "{":
-                open_brackets += 1
-            elif char == "}":
-                open_brackets -= 1
-            elif open_brackets == 0:
-                l += char
+    def __init__(self, text, line_starts=None):
+        if line_starts is not None:
+            self.line_starts = array('I', line_starts)
+            return
+        self.line_starts = array('I', [0])
+        self.line_starts.extend(match.end() for match in line_break.finditer(text))
 
-        code_list.append(l)
-    return code_list
+    # 1-based (line, column) of an offset
+    def line_column(self, offset):
+        line = bisect.bisect_right(self.line_starts, offset) - 1
+        return line + 1, offset - self.line_starts[line] + 1
+
+    # offset of a 1-based (line, column)
+    def offset(self, line, column):
+        return self.line_starts[line - 1] + column - 1
 
 # all possible token types. order determines priority.
 token_types = [
@@ -64,55 +181,104 @@ for regex_tuple in token_types:
 regex_str = regex_str[1:] # remove initial "|"
 generic_regex = re.compile(regex_str)
 
-# application entry point
-if __name__ == '__main__':
-    if len(sys.argv) < 2:
-        print('Usage: python3 pascalparser.py <input file>')
-        quit()
+token_counter = registry.counter('pascal_tokens_total', 'Tokens produced by the lexer.')
+token_histogram = registry.histogram(
+    'pascal_tokens_per_file', 'Tokens produced per tokenize call.',
+    buckets=(10, 100, 1000, 10000, 100000, 1000000)
+    )
+
+# splits the (comment free) lines into (token, classification, line) tuples.
+# with a SourceIndex of the original text, tokens are
+# (token, classification, line, column, offset) instead; shifts are the ones
+# filled in by prescan
+@timed('tokenize')
+def tokenize(lines, limits=None, index=None, shifts=None):
 
-    # tokens in file:
     tokens = []
+    if shifts is None:
+        shifts = {} # no comments were removed
+    if limits is not None:
+        limits.start()
 
-    with open(sys.argv[1], 'r') as file:
+    for line_num, line in enumerate(lines):
 
-        lines = file.readlines()
+        # look for all matches in this line
+        iterator = re.finditer(generic_regex, line.lower())
 
-        # Verify with the comments are ok
-        check_brackets("".join(lines))
+        # for each found match, try to narrow down match to a specific type
+        for match in iterator:
+            token_type = None
 
-        #remove comments
-        lines = remove_comments(lines)
+            for token_regex in token_types:
+                single_match = re.match(token_regex[0], match.group(0))
+                if single_match:
+                    token_type = token_regex[1]
+                    break
 
-        for line_num, line in enumerate(lines):
+            if token_type == 'comment':
+                # ignore comments
+                continue
 
+            if token_type == 'raise_exception':
+                # token without type: error!
+                raise Exception('`{}` could not be parsed.'.format(match.group(0)))
 
-            # regex matches for this line:
-            matches = []
+            if index is None:
+                tokens.append((single_match.group(0), token_type, line_num + 1))
+            else:
+                column = match.start()
+                if line_num in shifts:
+                    # add back the columns taken by comments before the token
+                    line_shifts = shifts[line_num]
+                    position = bisect.bisect_right(line_shifts, (column, float('inf'))) - 1
+                    column += line_shifts[position][1]
+                offset = index.line_starts[line_num] + column
+                tokens.append((single_match.group(0), token_type, line_num + 1, column + 1, offset))
+
+            # the clock every 1024 tokens, so a single huge line is stopped too
+            if limits is not None:
+                limits.check('max_tokens', len(tokens))
+                if not len(tokens) & 1023:
+                    limits.check_time()
+
+    token_counter.inc(len(tokens))
+    token_histogram.observe(len(tokens))
+    return tokens
 
-            # look for all matches in this line
-            iterator = re.finditer(generic_regex, line.lower())
+# application entry point
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: python3 pascalparser.py <input file> [--max-bytes N] [--max-tokens N] '
+              '[--max-seconds S] [--metrics FILE]')
+        quit()
 
-            # for each found match, try to narrow down match to a specific type
-            for match in iterator:
-                token_type = None
+    limits = parse_limits(sys.argv[2:])
 
-                for token_regex in token_types:
-                    single_match = re.match(token_regex[0], match.group(0))
-                    if single_match:
-                        token_type = token_regex[1]
-                        break
+    try:
+        # refuse oversized files before reading them
+        limits.check('max_bytes', os.path.getsize(sys.argv[1]))
 
-                if token_type == 'comment':
-                    # ignore comments
-                    continue
+        # newline='' keeps \r\n as two characters, as they are in the file
+        with open(sys.argv[1], 'r', newline='') as file:
 
-                if token_type == 'raise_exception':
-                    # token without type: error!
-                    raise Exception('`{}` could not be parsed.'.format(match.group(0)))
+            code = file.read()
 
-                tokens.append((single_match.group(0), token_type, line_num + 1))
+            # Verify with the comments are ok and remove them
+            shifts = {}
+            line_starts = []
+            lines = prescan(code, shifts, line_starts)
+
+            # tokens in file:
+            tokens = tokenize(lines, limits, SourceIndex(code, line_starts), shifts)
+    except LimitExceeded as e:
+        print('ERROR: {}'.format(e), file=sys.stderr)
+        sys.exit(2)
+    finally:
+        # --metrics FILE dumps the metrics, as JSON if FILE ends in .json
+        if '--metrics' in sys.argv:
+            registry.write(sys.argv[sys.argv.index('--metrics') + 1])
 
     # print out table
-    print('token,classification,line')
+    print('token,classification,line,column,offset')
     for token in tokens:
-        print('{},{},{}'.format(token[0].replace(',', '","'), token[1], token[2]))
+        print('{},{},{},{},{}'.format(token[0].replace(',', '","'), *token[1:]))
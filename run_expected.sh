@@ -0,0 +1,40 @@
+# checks every tests/<name>.<mode>.out against the output of running
+# tests/<name>.pas in that mode: lexer, outline, lint, sequential or parallel
+# (the error message, empty if the program is valid). fuzz replays a
+# reproducer saved by fuzzer.py in tests/regressions
+status=0
+for expected in tests/*.out tests/regressions/*.out; do
+    [ -e $expected ] || continue # no reproducers saved
+    base=${expected%.out}
+    mode=${base##*.}
+    name=${base%.*}
+
+    if [ $mode != fuzz ]; then
+        python3 pascalparser.py $name.pas > tmp.csv
+    fi
+    case $mode in
+        lexer)
+            cp tmp.csv tmp.out ;;
+        outline)
+            python3 pascalanalyzer.py tmp.csv --outline 2>/dev/null > tmp.out ;;
+        lint)
+            python3 dataflow.py tmp.csv > tmp.out 2>&1 ;;
+        sequential)
+            python3 pascalanalyzer.py tmp.csv 2>&1 >/dev/null \
+                | sed -n '/^[A-Za-z]*Exception: /,$p' | sed 's/^[A-Za-z]*Exception: //' > tmp.out ;;
+        parallel)
+            python3 pascalanalyzer.py tmp.csv --jobs 2 2>&1 >/dev/null \
+                | sed -n '/^[A-Za-z]*Exception: /,$p' | sed 's/^[A-Za-z]*Exception: //' > tmp.out ;;
+        fuzz)
+            python3 fuzzer.py --replay $name.pas > tmp.out ;;
+    esac
+
+    if diff -u $expected tmp.out; then
+        echo "ok   $base"
+    else
+        echo "FAIL $base"
+        status=1
+    fi
+done
+rm -f tmp.csv tmp.out
+exit $status
@@ -0,0 +1,12 @@
+program comentarios; {um comentario {aninhado} no cabecalho}
+var
+	a, b: integer; {varias
+linhas de
+   comentario} c: real;
+
+begin
+	a := 1{colado}+ 2;
+	{so um comentario}
+	b := a {x}{y} * 3;
+	c := 2.5 {acentuacao e ok}
+end.
@@ -0,0 +1,10 @@
+program quebras; {arquivo com quebras de linha CRLF}
+var
+	a, b: integer; {comentario
+em duas linhas} c: real;
+
+begin
+	a := 1;
+	b := a{colado}+ 2;
+	c := 2.5
+end.
@@ -0,0 +1,27 @@
+program lint; {avisos do dataflow.py}
+var
+	a, b, nunca: integer;
+
+procedure calcula(x: integer; y: real);
+var
+	r, s, t: integer;
+
+	procedure interno;
+	begin
+		t := 1
+	end;
+
+begin
+	if x > 0 then
+		r := 1;
+	s := r + x;
+	s := t;
+	while s > 0 do
+		s := s - 1
+end;
+
+begin
+	a := 1;
+	a := 2;
+	b := a
+end.
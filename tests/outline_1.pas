@@ -0,0 +1,4807 @@
+program indice; {centenas de procedimentos para o --outline}
+var
+	total: integer;
+
+procedure p0(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p1(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p2(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p3(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p4(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p5(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p6(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p7(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p8(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p9(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p10(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p11(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p12(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p13(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p14(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p15(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p16(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p17(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p18(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p19(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p20(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p21(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p22(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p23(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p24(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p25(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p26(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p27(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p28(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p29(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p30(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p31(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p32(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p33(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p34(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p35(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p36(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p37(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p38(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p39(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p40(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p41(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p42(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p43(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p44(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p45(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p46(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p47(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p48(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p49(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p50(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p51(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p52(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p53(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p54(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p55(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p56(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p57(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p58(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p59(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p60(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p61(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p62(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p63(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p64(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p65(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p66(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p67(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p68(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p69(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p70(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p71(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p72(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p73(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p74(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p75(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p76(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p77(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p78(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p79(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p80(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p81(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p82(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p83(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p84(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p85(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p86(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p87(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p88(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p89(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p90(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p91(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p92(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p93(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p94(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p95(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p96(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p97(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p98(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p99(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p100(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p101(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p102(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p103(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p104(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p105(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p106(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p107(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p108(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p109(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p110(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p111(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p112(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p113(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p114(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p115(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p116(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p117(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p118(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p119(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p120(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p121(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p122(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p123(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p124(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p125(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p126(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p127(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p128(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p129(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p130(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p131(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p132(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p133(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p134(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p135(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p136(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p137(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p138(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p139(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p140(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p141(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p142(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p143(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p144(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p145(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p146(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p147(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p148(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p149(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p150(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p151(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p152(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p153(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p154(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p155(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p156(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p157(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p158(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p159(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p160(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p161(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p162(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p163(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p164(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p165(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p166(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p167(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p168(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p169(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p170(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p171(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p172(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p173(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p174(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p175(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p176(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p177(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p178(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p179(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p180(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p181(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p182(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p183(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p184(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p185(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p186(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p187(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p188(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p189(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p190(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p191(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p192(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p193(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p194(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p195(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p196(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p197(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p198(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p199(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p200(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p201(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p202(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p203(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p204(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p205(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p206(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p207(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p208(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p209(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p210(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p211(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p212(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p213(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p214(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p215(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p216(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p217(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p218(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p219(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p220(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p221(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p222(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p223(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p224(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p225(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p226(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p227(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p228(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p229(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p230(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p231(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p232(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p233(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p234(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p235(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p236(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p237(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p238(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p239(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p240(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p241(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p242(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p243(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p244(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p245(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p246(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p247(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p248(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p249(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p250(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p251(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p252(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p253(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p254(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p255(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p256(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p257(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p258(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p259(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p260(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p261(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p262(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p263(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p264(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p265(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p266(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p267(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p268(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p269(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p270(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p271(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p272(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p273(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p274(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p275(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p276(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p277(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p278(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p279(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p280(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p281(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p282(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p283(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p284(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p285(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p286(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p287(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p288(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p289(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p290(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p291(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p292(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p293(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p294(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p295(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p296(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p297(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p298(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p299(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p300(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p301(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p302(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p303(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p304(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p305(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p306(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p307(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p308(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p309(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p310(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p311(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p312(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p313(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p314(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p315(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p316(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p317(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p318(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p319(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p320(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p321(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p322(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p323(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p324(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p325(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p326(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p327(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p328(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p329(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p330(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p331(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p332(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p333(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p334(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p335(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p336(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p337(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p338(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p339(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p340(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p341(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p342(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p343(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p344(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p345(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p346(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p347(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p348(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p349(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p350(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p351(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p352(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p353(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p354(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p355(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p356(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p357(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p358(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p359(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p360(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p361(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p362(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p363(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p364(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p365(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p366(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p367(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p368(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p369(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p370(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p371(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p372(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p373(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p374(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p375(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p376(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p377(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p378(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p379(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p380(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p381(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p382(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p383(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p384(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p385(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p386(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p387(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p388(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p389(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p390(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p391(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p392(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p393(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p394(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p395(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p396(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p397(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p398(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p399(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p400(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p401(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p402(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p403(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p404(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p405(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p406(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p407(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p408(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p409(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p410(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p411(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p412(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p413(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p414(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p415(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p416(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p417(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p418(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p419(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p420(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p421(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p422(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p423(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p424(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p425(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p426(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p427(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p428(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p429(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p430(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p431(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p432(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p433(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p434(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p435(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p436(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p437(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p438(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p439(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p440(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p441(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p442(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p443(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p444(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p445(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p446(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p447(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p448(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p449(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p450(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p451(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p452(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p453(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p454(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p455(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p456(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p457(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p458(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p459(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p460(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p461(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p462(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p463(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p464(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p465(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p466(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p467(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p468(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p469(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p470(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p471(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p472(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p473(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p474(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p475(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p476(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p477(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p478(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p479(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p480(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p481(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p482(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p483(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p484(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p485(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p486(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p487(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p488(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p489(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p490(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p491(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p492(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p493(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p494(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p495(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p496(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p497(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p498(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p499(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p500(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p501(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p502(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p503(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p504(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p505(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p506(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p507(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p508(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p509(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p510(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p511(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p512(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p513(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p514(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p515(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p516(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p517(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p518(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p519(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p520(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p521(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p522(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p523(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p524(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p525(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p526(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p527(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p528(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p529(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p530(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p531(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p532(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p533(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p534(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p535(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p536(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p537(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p538(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p539(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p540(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p541(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p542(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p543(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p544(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p545(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p546(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p547(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p548(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p549(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p550(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p551(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p552(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p553(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p554(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p555(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p556(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p557(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p558(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p559(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p560(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p561(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p562(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p563(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p564(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p565(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p566(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p567(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p568(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p569(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p570(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p571(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p572(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p573(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p574(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p575(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p576(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p577(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p578(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p579(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p580(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p581(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p582(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p583(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p584(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p585(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p586(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p587(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p588(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p589(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p590(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p591(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p592(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p593(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p594(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p595(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p596(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p597(x: integer; y: integer);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p598(x: integer; y: real);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+procedure p599(x: integer; y: boolean);
+var
+	t: integer;
+begin
+	t := x;
+	total := t
+end;
+
+begin
+	total := 0
+end.
@@ -0,0 +1,30 @@
+program paralelo; {procedimentos analisados em paralelo com --jobs}
+var
+	a, b: integer;
+
+procedure first(x: integer);
+begin
+	a := x
+end;
+
+procedure second;
+var
+	c: integer;
+begin
+	first := 1;
+	later := 2
+end;
+
+procedure first;
+begin
+	b := 1
+end;
+
+procedure later;
+begin
+	a := 2
+end;
+
+begin
+	a := 1
+end.
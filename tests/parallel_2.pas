@@ -0,0 +1,30 @@
+program paralelo; {mesmo resultado com e sem --jobs}
+var
+	a: integer;
+
+procedure one(x: integer);
+var
+	y: real;
+begin
+	y := x;
+	a := 1
+end;
+
+procedure two;
+	procedure inner;
+	begin
+		a := 2
+	end;
+begin
+	if a > 1 then
+		begin
+			a := 1
+		end
+	else
+		a := 0
+end;
+
+begin
+	while a < 10 do
+		a := a + 1
+end.
@@ -0,0 +1,16 @@
+program divisao; {unidades que a varredura de --jobs nao separa}
+var
+	a: integer;
+
+procedure sem_begin(x: integer);
+	a := x
+end;
+
+procedure depois;
+begin
+	a := 1
+end;
+
+begin
+	a := 2
+end.